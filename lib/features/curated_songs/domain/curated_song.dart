@@ -76,8 +76,8 @@ class CuratedSong {
 
   /// Runnability score (0-100) combining crowd signal and audio features.
   ///
-  /// Computed offline by tools/enrich_runnability.py. Songs with strong
-  /// crowd signal (many running playlist appearances) score 80-100.
+  /// Computed offline by `python3 -m tools enrich runnability`. Songs with
+  /// strong crowd signal (many running playlist appearances) score 80-100.
   /// Feature-only songs (no crowd data) score 15-40.
   final int? runnability;
 
@@ -0,0 +1,125 @@
+import 'dart:convert';
+import 'dart:io';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:running_playlist_ai/features/bpm_lookup/domain/bpm_matcher.dart';
+import 'package:running_playlist_ai/features/bpm_lookup/domain/bpm_song.dart';
+import 'package:running_playlist_ai/features/curated_songs/domain/curated_song.dart';
+import 'package:running_playlist_ai/features/song_quality/domain/song_quality_scorer.dart';
+import 'package:running_playlist_ai/features/taste_profile/domain/taste_profile.dart';
+
+/// Consistency checks for assets/curated_scoring.json, exported by
+/// `python3 -m tools scoring`. The table must agree with the live scorer,
+/// otherwise runtime scores built on it would silently drift.
+void main() {
+  final table = jsonDecode(
+    File('assets/curated_scoring.json').readAsStringSync(),
+  ) as Map<String, dynamic>;
+  final curated = (jsonDecode(
+    File('assets/curated_songs.json').readAsStringSync(),
+  ) as List<dynamic>)
+      .map((s) => CuratedSong.fromJson(s as Map<String, dynamic>))
+      .toList();
+
+  final keys = (table['keys'] as List<dynamic>).cast<String>();
+  final staticScores = (table['staticScore'] as List<dynamic>).cast<int>();
+  final genreMasks = (table['genreMask'] as List<dynamic>).cast<int>();
+  final tempoTargets = (table['tempoTargets'] as List<dynamic>)
+      .map((t) => (t as List<dynamic>).cast<int>())
+      .toList();
+  final indexByKey = {for (var i = 0; i < keys.length; i++) keys[i]: i};
+
+  // ──────────────────────────────────────────────────────
+  // Weight constants and enum orders
+  // ──────────────────────────────────────────────────────
+  group('Table metadata', () {
+    test('weights match SongQualityScorer constants', () {
+      expect(table['weights'], {
+        'artistMatchWeight': SongQualityScorer.artistMatchWeight,
+        'genreMatchWeight': SongQualityScorer.genreMatchWeight,
+        'exactBpmWeight': SongQualityScorer.exactBpmWeight,
+        'tempoVariantWeight': SongQualityScorer.tempoVariantWeight,
+        'artistDiversityPenalty': SongQualityScorer.artistDiversityPenalty,
+        'dislikedArtistPenalty': SongQualityScorer.dislikedArtistPenalty,
+        'likedSongWeight': SongQualityScorer.likedSongWeight,
+        'looseTempoVariantWeight': SongQualityScorer.looseTempoVariantWeight,
+        'decadeMatchWeight': SongQualityScorer.decadeMatchWeight,
+        'danceabilityMaxWeight': SongQualityScorer.danceabilityMaxWeight,
+        'danceabilityNeutral': SongQualityScorer.danceabilityNeutral,
+        'runnabilityMaxWeight': SongQualityScorer.runnabilityMaxWeight,
+        'runnabilityNeutral': SongQualityScorer.runnabilityNeutral,
+      });
+    });
+
+    test('genre bit order matches RunningGenre', () {
+      expect(
+        table['genres'],
+        RunningGenre.values.map((g) => g.name).toList(),
+      );
+    });
+
+    test('covers every curated song', () {
+      expect(
+        keys.toSet(),
+        curated.map((s) => s.lookupKey).toSet(),
+      );
+    });
+  });
+
+  // ──────────────────────────────────────────────────────
+  // Per-song components
+  // ──────────────────────────────────────────────────────
+  group('Per-song components', () {
+    test('static score equals scorer runnability + danceability', () {
+      for (final song in curated) {
+        final i = indexByKey[song.lookupKey]!;
+        // With no taste profile, previous artist or likes, an exact-match
+        // score is exactly the static terms plus the exact BPM bonus.
+        final score = SongQualityScorer.score(
+          song: BpmSong(
+            songId: song.lookupKey,
+            title: song.title,
+            artistName: song.artistName,
+            tempo: song.bpm ?? 0,
+            danceability: song.danceability,
+          ),
+          runnability: song.runnability,
+        );
+        expect(
+          staticScores[i],
+          score - SongQualityScorer.exactBpmWeight,
+          reason: song.lookupKey,
+        );
+      }
+    });
+
+    test('genre mask has the bit of the song genre', () {
+      for (final song in curated) {
+        final genre = RunningGenre.tryFromJson(song.genre);
+        final expected = genre == null ? 0 : 1 << genre.index;
+        expect(
+          genreMasks[indexByKey[song.lookupKey]!],
+          expected,
+          reason: song.lookupKey,
+        );
+      }
+    });
+
+    test('tempo targets are exactly the cadences BpmMatcher serves', () {
+      for (final song in curated) {
+        final targets = tempoTargets[indexByKey[song.lookupKey]!];
+        final exported = {
+          for (var j = 0; j < targets.length; j += 2)
+            (targets[j], BpmMatchType.values[targets[j + 1]]),
+        };
+        final expected = <(int, BpmMatchType)>{
+          if (song.bpm != null)
+            for (var c = 1; c <= BpmMatcher.maxQueryBpm; c++)
+              if (BpmMatcher.bpmQueries(c)[song.bpm] case final type?)
+                (c, type),
+        };
+        expect(exported, expected, reason: song.lookupKey);
+      }
+    });
+  });
+}
@@ -0,0 +1,18 @@
+"""Offline curation tools for assets/curated_songs.json.
+
+The modules use package-relative imports and are not runnable as scripts
+(`python3 tools/enrich_runnability.py` no longer works). Run everything
+from the project root through the single CLI entry point:
+
+    python3 -m tools verify                          # was tools/verify_curated_bpm.py
+    python3 -m tools verify-queue --max-requests N   # priority-scheduled verify
+    python3 -m tools cleanup                         # was tools/cleanup_curated.py
+    python3 -m tools enrich danceability             # was tools/enrich_danceability.py
+    python3 -m tools enrich runnability              # was tools/enrich_runnability.py
+    python3 -m tools crowd {ingest,apply,top}
+    python3 -m tools coverage
+    python3 -m tools scoring [--check]
+    python3 -m tools lookup <artist> <title>
+
+See `python3 -m tools --help` and `python3 -m tools <command> --help`.
+"""
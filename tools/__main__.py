@@ -0,0 +1,164 @@
+"""Command-line entry point for the curation tools.
+
+Usage:
+    python3 -m tools verify
+    python3 -m tools verify-queue [--max-requests N] [--max-minutes M] [--continuous]
+    python3 -m tools cleanup
+    python3 -m tools enrich {danceability,runnability}
+    python3 -m tools crowd {ingest,apply,top} ...
+    python3 -m tools coverage [--depth N] [--strict]
+    python3 -m tools scoring [--check]
+    python3 -m tools lookup <artist> <title>
+
+Subcommand modules are imported only when their command runs, so `--help`
+and `lookup` never load the full datasets.
+"""
+
+import argparse
+import importlib
+import sys
+
+
+def _run_module(name: str):
+    """Import tools.<name> lazily and run its main()."""
+    return importlib.import_module(f'.{name}', __package__).main()
+
+
+def cmd_verify(args):
+    return _run_module('verify_curated_bpm')
+
+
+def cmd_verify_queue(args):
+    from .verify_queue import main
+    return main(args.forward_args)
+
+
+def cmd_cleanup(args):
+    return _run_module('cleanup_curated')
+
+
+def cmd_enrich(args):
+    return _run_module(f'enrich_{args.feature}')
+
+
+def cmd_crowd(args):
+    from .crowd_signal import main
+    return main(args.forward_args)
+
+
+def cmd_coverage(args):
+    from .coverage import main
+    return main(args.forward_args)
+
+
+def cmd_scoring(args):
+    from .scoring_tables import main
+    return main(args.forward_args)
+
+
+def cmd_lookup(args):
+    from .lookup_index import lookup
+
+    result = lookup(args.artist, args.title)
+    if result is None:
+        print(f'Not found: {args.artist} - {args.title}', file=sys.stderr)
+        return 1
+
+    curated = result['curated']
+    verification = result['verification']
+    track = result['track']
+
+    print(result['key'])
+    if curated:
+        print(
+            f"  Curated:      bpm={curated.get('bpm')}  genre={curated.get('genre')}"
+            f"  decade={curated.get('decade')}  duration={curated.get('durationSeconds')}s"
+        )
+        print(
+            f"                danceability={curated.get('danceability')}"
+            f"  runnability={curated.get('runnability')}"
+        )
+    else:
+        print('  Curated:      (not in curated dataset)')
+    if verification and verification.get('status') == 'ok':
+        print(
+            f"  Deezer:       bpm={verification.get('deezer_bpm')}"
+            f"  duration={verification.get('deezer_duration')}s"
+            f"  id={verification.get('deezer_id')}"
+        )
+        print(
+            f"                match={verification.get('deezer_artist')}"
+            f" - {verification.get('deezer_title')}"
+        )
+    elif verification:
+        print(f"  Deezer:       {verification.get('status')}")
+    else:
+        print('  Deezer:       (not verified)')
+    if track:
+        print(f"  Released:     {track.get('release_date')}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python3 -m tools',
+        description='Curation tools for assets/curated_songs.json.',
+    )
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    verify = sub.add_parser('verify', help='verify BPM and duration against Deezer')
+    verify.set_defaults(func=cmd_verify)
+
+    verify_queue = sub.add_parser(
+        'verify-queue', help='verify highest-impact songs first, within a budget',
+        add_help=False,
+    )
+    verify_queue.add_argument('forward_args', nargs=argparse.REMAINDER)
+    verify_queue.set_defaults(func=cmd_verify_queue)
+
+    cleanup = sub.add_parser('cleanup', help='build the Deezer-verified clean dataset')
+    cleanup.set_defaults(func=cmd_cleanup)
+
+    enrich = sub.add_parser('enrich', help='enrich curated songs with derived scores')
+    enrich.add_argument('feature', choices=['danceability', 'runnability'])
+    enrich.set_defaults(func=cmd_enrich)
+
+    crowd = sub.add_parser(
+        'crowd', help='incremental crowd-signal store', add_help=False,
+    )
+    crowd.add_argument('forward_args', nargs=argparse.REMAINDER)
+    crowd.set_defaults(func=cmd_crowd)
+
+    coverage = sub.add_parser(
+        'coverage', help='cadence coverage histograms and gap report', add_help=False,
+    )
+    coverage.add_argument('forward_args', nargs=argparse.REMAINDER)
+    coverage.set_defaults(func=cmd_coverage)
+
+    scoring = sub.add_parser(
+        'scoring', help='export precomputed scoring tables for the app', add_help=False,
+    )
+    scoring.add_argument('forward_args', nargs=argparse.REMAINDER)
+    scoring.set_defaults(func=cmd_scoring)
+
+    lookup = sub.add_parser('lookup', help='show everything known about one song')
+    lookup.add_argument('artist')
+    lookup.add_argument('title')
+    lookup.set_defaults(func=cmd_lookup)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    # Commands with their own parser get everything (including -h) forwarded
+    args, extra = parser.parse_known_args(argv)
+    if hasattr(args, 'forward_args'):
+        args.forward_args = extra + args.forward_args
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
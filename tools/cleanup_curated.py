@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """Clean curated_songs.json: keep only verified data, strip made-up fields.
 
 - Removes songs not found on Deezer (167)
@@ -9,38 +8,26 @@
 - Keeps: genre (unverified but no API source available — kept for scoring)
 
 Re-fetches Deezer track data for release_date. Saves progress.
+
+Usage:
+    python3 -m tools cleanup
 """
 
 import json
 import os
-import subprocess
-import sys
 import time
-import urllib.parse
 
-CURATED_PATH = os.path.join(
-    os.path.dirname(__file__), '..', 'assets', 'curated_songs.json'
+from .common import (
+    API_DELAY,
+    CLEAN_PATH as OUTPUT_PATH,
+    CLEANUP_REPORT_PATH as REPORT_PATH,
+    CURATED_PATH,
+    SAVE_INTERVAL,
+    TRACK_CACHE_PATH,
+    VERIFICATION_PATH,
+    curl_json,
+    make_key,
 )
-VERIFICATION_PATH = os.path.join(os.path.dirname(__file__), 'bpm_verification.json')
-TRACK_CACHE_PATH = os.path.join(os.path.dirname(__file__), 'deezer_tracks.json')
-OUTPUT_PATH = os.path.join(os.path.dirname(__file__), 'curated_songs_clean.json')
-REPORT_PATH = os.path.join(os.path.dirname(__file__), 'cleanup_report.txt')
-
-API_DELAY = 0.35
-SAVE_INTERVAL = 50
-
-
-def _curl_json(url):
-    try:
-        result = subprocess.run(
-            ['curl', '-s', '--max-time', '10', url],
-            capture_output=True, text=True, timeout=15,
-        )
-        if result.returncode != 0:
-            return None
-        return json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError):
-        return None
 
 
 def release_date_to_decade(release_date):
@@ -71,9 +58,6 @@ def main():
     print(f'Loaded {len(songs)} curated songs')
     print(f'Track cache: {len(track_cache)} entries')
 
-    def make_key(s):
-        return f"{s['artistName'].lower().strip()}|{s['title'].lower().strip()}"
-
     # Phase 1: Fetch full track data for release_date where we have deezer_id
     need_fetch = []
     for song in songs:
@@ -88,7 +72,7 @@ def main():
     print(f'Need to fetch {len(need_fetch)} tracks for release_date')
 
     for i, (key, deezer_id) in enumerate(need_fetch):
-        data = _curl_json(f'https://api.deezer.com/track/{deezer_id}')
+        data = curl_json(f'https://api.deezer.com/track/{deezer_id}')
         time.sleep(API_DELAY)
 
         if data and 'error' not in data:
@@ -202,7 +186,3 @@ def main():
 
     print(f'\nClean dataset: {OUTPUT_PATH}')
     print(f'Report: {REPORT_PATH}')
-
-
-if __name__ == '__main__':
-    main()
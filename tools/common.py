@@ -0,0 +1,52 @@
+"""Shared paths and helpers for the curation tools.
+
+Kept dependency-free and cheap to import: nothing here reads a dataset at
+import time, so the CLI can start without touching any JSON.
+"""
+
+import json
+import os
+import subprocess
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(TOOLS_DIR)
+
+# ── Datasets ──
+CURATED_PATH = os.path.join(PROJECT_ROOT, 'assets', 'curated_songs.json')
+CORRECTED_PATH = os.path.join(TOOLS_DIR, 'curated_songs_corrected.json')
+CLEAN_PATH = os.path.join(TOOLS_DIR, 'curated_songs_clean.json')
+
+# ── Deezer caches ──
+BPM_PROGRESS_PATH = os.path.join(TOOLS_DIR, 'bpm_progress.json')
+VERIFICATION_PATH = os.path.join(TOOLS_DIR, 'bpm_verification.json')
+TRACK_CACHE_PATH = os.path.join(TOOLS_DIR, 'deezer_tracks.json')
+
+# ── Reports ──
+BPM_REPORT_PATH = os.path.join(TOOLS_DIR, 'bpm_report.txt')
+CLEANUP_REPORT_PATH = os.path.join(TOOLS_DIR, 'cleanup_report.txt')
+
+API_DELAY = 0.35         # seconds between Deezer API calls
+SAVE_INTERVAL = 50       # save progress every N songs
+
+
+def normalize_key(artist: str, title: str) -> str:
+    """Normalized 'artist|title' key, matching the app's SongKey.normalize."""
+    return f'{artist.lower().strip()}|{title.lower().strip()}'
+
+
+def make_key(song: dict) -> str:
+    return normalize_key(song['artistName'], song['title'])
+
+
+def curl_json(url: str) -> dict | None:
+    """Fetch a URL with curl and parse as JSON."""
+    try:
+        result = subprocess.run(
+            ['curl', '-s', '--max-time', '10', url],
+            capture_output=True, text=True, timeout=15,
+        )
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout)
+    except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError):
+        return None
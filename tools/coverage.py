@@ -0,0 +1,292 @@
+"""Cadence coverage analysis for the curated catalogue.
+
+For every running cadence (150-200 spm, the app's StrideCalculator range)
+counts how many curated songs with a verified BPM are compatible with it,
+using the same rule as the app's bpm_compatibility.dart: exact or within 5%
+of the cadence, its half-time or its double-time. Counts are reported
+overall, per genre and per decade, and cadence ranges below a target depth
+are flagged.
+
+Songs are binned once into a per-BPM histogram; per-cadence counts are then
+read off prefix sums over the compatible BPM windows, so the whole analysis
+is a handful of passes over a ~450-entry array per group rather than a
+songs x cadences loop. Fast enough to run on every curation build.
+
+Finally ranks songs without a verified BPM (Deezer BPM=0, never verified, or
+null BPM) by how much they would fill the flagged gaps: songs with a curated
+BPM guess count towards the cadences that guess is compatible with; songs
+with no BPM at all are spread over their genre's verified BPM distribution.
+Songs Deezer already failed to find are left out of the ranking, since
+re-verifying them is unlikely to help.
+
+Usage:
+    python3 -m tools coverage [--depth 40] [--group-depth 8] [--strict]
+
+Outputs:
+    tools/coverage_report.txt - Histograms, flagged gaps, gap-filling candidates
+"""
+
+import argparse
+import json
+import math
+import os
+
+from .common import CURATED_PATH, TOOLS_DIR, make_key
+from .verify_curated_bpm import load_progress
+
+REPORT_PATH = os.path.join(TOOLS_DIR, 'coverage_report.txt')
+
+MIN_CADENCE = 150        # StrideCalculator clamps cadence to 150-200 spm
+MAX_CADENCE = 200
+TOLERANCE = 0.05         # bpm_compatibility.dart "close" threshold
+HIST_SIZE = math.ceil(MAX_CADENCE * 2 * (1 + TOLERANCE)) + 2
+
+TARGET_DEPTH = 40        # compatible songs wanted at every cadence overall
+GROUP_TARGET_DEPTH = 8   # ... and per genre / decade
+TOP_CANDIDATES = 50
+
+CADENCES = range(MIN_CADENCE, MAX_CADENCE + 1)
+
+
+# ── Binning ──
+
+def compatible_windows(cadence: int) -> list[tuple[int, int]]:
+    """Inclusive BPM windows compatible with a cadence (match or close).
+
+    Mirrors bpm_compatibility.dart: targets are cadence, cadence ~/ 2 and
+    cadence * 2, each with a tolerance of ceil(target * 5%). Overlapping
+    windows are merged so no song is counted twice.
+    """
+    windows = []
+    for target in sorted((cadence // 2, cadence, cadence * 2)):
+        tol = math.ceil(target * TOLERANCE)
+        lo, hi = max(target - tol, 0), min(target + tol, HIST_SIZE - 1)
+        if windows and lo <= windows[-1][1] + 1:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], hi))
+        else:
+            windows.append((lo, hi))
+    return windows
+
+
+WINDOWS = {c: compatible_windows(c) for c in CADENCES}
+
+
+def histogram(bpms) -> list[int]:
+    hist = [0] * HIST_SIZE
+    for bpm in bpms:
+        if 0 < bpm < HIST_SIZE:
+            hist[bpm] += 1
+    return hist
+
+
+def cadence_counts(hist: list[int]) -> list[int]:
+    """Compatible song count for each cadence in CADENCES."""
+    prefix = [0] * (HIST_SIZE + 1)
+    for i, n in enumerate(hist):
+        prefix[i + 1] = prefix[i] + n
+    return [
+        sum(prefix[hi + 1] - prefix[lo] for lo, hi in WINDOWS[c])
+        for c in CADENCES
+    ]
+
+
+def compatible_cadences(bpm: int) -> list[int]:
+    """Indices into CADENCES that a song of this BPM is compatible with."""
+    return [
+        i for i, c in enumerate(CADENCES)
+        if any(lo <= bpm <= hi for lo, hi in WINDOWS[c])
+    ]
+
+
+# ── Gaps ──
+
+def gap_ranges(counts: list[int], depth: int) -> list[tuple[int, int, int]]:
+    """Contiguous cadence ranges below depth as (start, end, min_count)."""
+    ranges = []
+    for i, n in enumerate(counts):
+        if n >= depth:
+            continue
+        c = CADENCES[i]
+        if ranges and ranges[-1][1] == c - 1:
+            start, _, low = ranges[-1]
+            ranges[-1] = (start, c, min(low, n))
+        else:
+            ranges.append((c, c, n))
+    return ranges
+
+
+def deficits(counts: list[int], depth: int) -> list[float]:
+    """Per-cadence shortfall as a fraction of the target depth (0-1)."""
+    return [max(depth - n, 0) / depth for n in counts]
+
+
+# ── Analysis ──
+
+def verified_bpm(result: dict | None) -> int | None:
+    if result and result.get('status') == 'ok' and result.get('deezer_bpm'):
+        return round(result['deezer_bpm'])
+    return None
+
+
+def analyze(songs: list, progress: dict, depth: int, group_depth: int) -> dict:
+    verified = []     # (song, bpm)
+    unverified = []   # (song, curated bpm guess or None)
+    not_found = []    # Deezer has no match; not worth re-verifying
+    seen = set()
+    for song in songs:
+        key = make_key(song)
+        if key in seen:
+            continue
+        seen.add(key)
+        result = progress.get(key)
+        bpm = verified_bpm(result)
+        if bpm is not None:
+            verified.append((song, bpm))
+        elif result and result.get('status') == 'not_found':
+            not_found.append(song)
+        else:
+            unverified.append((song, song.get('bpm')))
+
+    groups = {'all': [bpm for _, bpm in verified]}
+    for song, bpm in verified:
+        groups.setdefault(f"genre:{song.get('genre')}", []).append(bpm)
+        groups.setdefault(f"decade:{song.get('decade')}", []).append(bpm)
+
+    counts = {name: cadence_counts(histogram(bpms)) for name, bpms in groups.items()}
+    targets = {name: depth if name == 'all' else group_depth for name in groups}
+    gaps = {name: gap_ranges(counts[name], targets[name]) for name in groups}
+
+    return {
+        'verified': verified,
+        'unverified': unverified,
+        'not_found': not_found,
+        'groups': groups,
+        'counts': counts,
+        'targets': targets,
+        'gaps': gaps,
+        'candidates': rank_candidates(unverified, groups, counts, targets),
+    }
+
+
+def rank_candidates(unverified, groups, counts, targets) -> list[tuple[float, dict, int | None]]:
+    """Rank unverified songs by expected gap fill across their groups.
+
+    Gap fill is the sum of deficits at the cadences a song would cover, over
+    the overall, genre and decade histograms. Songs without a BPM guess get
+    the expected value under their genre's verified BPM distribution.
+    """
+    deficit = {name: deficits(counts[name], targets[name]) for name in counts}
+    # P(compatible with cadence) for a random verified song of each genre
+    genre_share = {
+        name: [n / len(groups[name]) for n in counts[name]]
+        for name in counts if name.startswith('genre:')
+    }
+
+    ranked = []
+    for song, guess in unverified:
+        names = [n for n in (
+            'all', f"genre:{song.get('genre')}", f"decade:{song.get('decade')}",
+        ) if n in deficit]
+        if guess is not None:
+            cover = compatible_cadences(guess)
+            fill = sum(deficit[n][i] for n in names for i in cover)
+        else:
+            share = genre_share.get(f"genre:{song.get('genre')}")
+            if share is None:
+                continue
+            fill = sum(deficit[n][i] * p for n in names for i, p in enumerate(share))
+        if fill > 0:
+            ranked.append((fill, song, guess))
+
+    ranked.sort(key=lambda r: (r[0], r[1].get('runnability') or 0), reverse=True)
+    return ranked
+
+
+# ── Report ──
+
+def _bar(n: int, depth: int) -> str:
+    return '#' * (n // 5) + (' <' if n < depth else '')
+
+
+def write_report(result: dict, path: str = REPORT_PATH):
+    counts = result['counts']
+    targets = result['targets']
+    gaps = result['gaps']
+    lines = [
+        'Cadence Coverage Report',
+        '=======================',
+        f"Verified BPM songs:   {len(result['verified'])}",
+        f"Unverified/null BPM: {len(result['unverified'])}",
+        f"Not found on Deezer: {len(result['not_found'])} (not ranked)",
+        f'Cadence range:        {MIN_CADENCE}-{MAX_CADENCE} spm '
+        f'(exact, half-time, double-time within {TOLERANCE:.0%})',
+        '',
+        f"--- OVERALL (target depth {targets['all']}) ---",
+        '',
+    ]
+    for c, n in zip(CADENCES, counts['all']):
+        lines.append(f'  {c:3d}: {n:4d} {_bar(n, targets["all"])}')
+
+    lines += ['', '--- GAPS (cadence ranges below target depth) ---', '']
+    for name in sorted(gaps, key=lambda n: (n != 'all', n)):
+        if not gaps[name]:
+            continue
+        ranges = ', '.join(
+            f'{s}-{e} (min {low})' if s != e else f'{s} ({low})'
+            for s, e, low in gaps[name]
+        )
+        lines.append(f'  {name:18s} [{len(result["groups"][name]):4d} songs] {ranges}')
+
+    lines += [
+        '',
+        f'--- TOP {TOP_CANDIDATES} GAP-FILLING CANDIDATES (verify these first) ---',
+        '',
+    ]
+    for fill, song, guess in result['candidates'][:TOP_CANDIDATES]:
+        bpm = f'~{guess}' if guess is not None else '?'
+        lines.append(
+            f'  {fill:6.2f}  bpm={bpm:>4}  {song.get("genre", ""):12s} '
+            f'{song["artistName"]} - {song["title"]}'
+        )
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f'expected a positive integer, got {value}')
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m tools coverage', description=__doc__.splitlines()[0],
+    )
+    parser.add_argument('--depth', type=_positive_int, default=TARGET_DEPTH,
+                        help='target compatible songs per cadence overall')
+    parser.add_argument('--group-depth', type=_positive_int, default=GROUP_TARGET_DEPTH,
+                        help='target compatible songs per cadence per genre/decade')
+    parser.add_argument('--strict', action='store_true',
+                        help='exit non-zero if the overall catalogue has gaps')
+    args = parser.parse_args(argv)
+
+    with open(CURATED_PATH) as f:
+        songs = json.load(f)
+    result = analyze(songs, load_progress(), args.depth, args.group_depth)
+    write_report(result)
+
+    overall = result['gaps']['all']
+    thin_groups = sum(1 for name, g in result['gaps'].items() if g and name != 'all')
+    print(f"Verified BPM songs:   {len(result['verified'])}")
+    print(f"Unverified/null BPM: {len(result['unverified'])}")
+    print(f"Not found on Deezer: {len(result['not_found'])} (not ranked)")
+    print(f'Overall gaps:         {len(overall)} cadence ranges below {args.depth}')
+    for start, end, low in overall:
+        print(f'  {start}-{end} spm (min {low} songs)')
+    print(f'Thin genres/decades:  {thin_groups}')
+    print(f"Gap-filling candidates: {len(result['candidates'])}")
+    print(f'Report written to: {REPORT_PATH}')
+
+    return 1 if args.strict and overall else 0
@@ -0,0 +1,363 @@
+"""Incremental crowd-signal aggregation for runnability scoring.
+
+enrich_runnability.py rebuilds its crowd map from one static extraction dump
+on every run. This store instead ingests running-playlist extraction batches
+one at a time and keeps a time-decayed popularity signal per song:
+
+- A count-min sketch (conservative update) holds decayed appearance counts
+  for every song ever seen, in fixed memory regardless of how many batches
+  accumulate.
+- A bounded heavy-hitters list keeps the most popular songs with their
+  source_count and timestamps accumulated since each song was admitted to
+  the list (`tracked_since`); history from before admission lives only in
+  the sketch.
+
+Decay uses forward decay: a batch ingested at time t adds
+source_count * 2^((t - landmark) / half_life), and queries divide by the same
+factor at query time. Counters never need to be touched on ingest, only
+rescaled occasionally to keep the numbers in float range.
+
+Runnability is then recomputed only for curated songs whose crowd points
+(0-60) changed since the last apply. A song the store has never applied and
+has no signal for is left untouched, so a store seeded with only recent
+batches does not wipe crowd points computed from older dumps; pass
+`--replace` to recompute those songs feature-only as well.
+
+Usage:
+    python3 -m tools crowd ingest <extracted_songs.json> [--at YYYY-MM-DD]
+    python3 -m tools crowd apply [--dry-run] [--replace]
+    python3 -m tools crowd top [-n 20]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+import time
+from array import array
+from datetime import datetime, timezone
+
+from .common import CURATED_PATH, TOOLS_DIR, make_key
+from .enrich_runnability import compute_runnability, crowd_score
+from .scoring_tables import export as export_scoring
+
+STORE_PATH = os.path.join(TOOLS_DIR, "crowd_signal.json")
+
+SKETCH_WIDTH = 16384     # counters per row (error ~ e / width * total mass)
+SKETCH_DEPTH = 5         # independent rows (failure prob ~ e^-depth)
+HEAVY_HITTERS = 500      # songs tracked exactly with timestamps
+HALF_LIFE_DAYS = 180     # crowd signal halves every ~6 months
+MIN_SIGNAL = 1.0         # decayed count below which a song has no crowd signal
+RESCALE_EXPONENT = 60    # rescale counters before 2^exponent overflows precision
+
+DAY_SECONDS = 86400
+
+
+def _hashes(key):
+    """Return (h1, h2) for double hashing a key into sketch rows."""
+    digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return h1, h2
+
+
+class CountMinSketch:
+    """Count-min sketch with conservative update over float32 counters."""
+
+    def __init__(self, width=SKETCH_WIDTH, depth=SKETCH_DEPTH, rows=None):
+        self.width = width
+        self.depth = depth
+        self.rows = rows or [array("f", bytes(4 * width)) for _ in range(depth)]
+
+    def _cells(self, key):
+        h1, h2 = _hashes(key)
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def estimate(self, key):
+        return min(row[c] for row, c in zip(self.rows, self._cells(key)))
+
+    def add(self, key, amount):
+        """Add amount to key; only raises counters below the new estimate."""
+        cells = self._cells(key)
+        target = min(row[c] for row, c in zip(self.rows, cells)) + amount
+        for row, c in zip(self.rows, cells):
+            if row[c] < target:
+                row[c] = target
+        return target
+
+    def scale(self, factor):
+        for row in self.rows:
+            for c in range(self.width):
+                row[c] *= factor
+
+    def to_json(self):
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "rows": [base64.b64encode(row.tobytes()).decode() for row in self.rows],
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        rows = []
+        for encoded in data["rows"]:
+            row = array("f")
+            row.frombytes(base64.b64decode(encoded))
+            rows.append(row)
+        return cls(data["width"], data["depth"], rows)
+
+
+class CrowdSignalStore:
+    """Persistent, bounded-memory store of time-decayed crowd signal."""
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.half_life = data.get("half_life_days", HALF_LIFE_DAYS) * DAY_SECONDS
+        self.landmark = data.get("landmark")
+        self.sketch = (
+            CountMinSketch.from_json(data["sketch"]) if "sketch" in data
+            else CountMinSketch()
+        )
+        # key -> {weight, count, tracked_since, last_seen}; weight is
+        # forward-decayed, count and tracked_since restart on (re)admission
+        self.heavy = data.get("heavy_hitters", {})
+        # batch id -> ingest timestamp, so re-ingesting the same file is a no-op
+        self.batches = data.get("batches", {})
+        # curated key -> crowd points (0-60, or None) last written to the asset
+        self.applied = data.get("applied", {})
+
+    @classmethod
+    def load(cls, path=STORE_PATH):
+        if os.path.exists(path):
+            with open(path) as f:
+                return cls(json.load(f))
+        return cls()
+
+    def save(self, path=STORE_PATH):
+        data = {
+            "half_life_days": self.half_life / DAY_SECONDS,
+            "landmark": self.landmark,
+            "sketch": self.sketch.to_json(),
+            "heavy_hitters": self.heavy,
+            "batches": self.batches,
+            "applied": self.applied,
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    # ── Decay ──
+
+    def _exponent(self, at):
+        return (at - self.landmark) / self.half_life
+
+    def _rescale(self, at):
+        """Move the landmark to `at` so forward-decay weights stay small."""
+        factor = 2.0 ** -self._exponent(at)
+        self.sketch.scale(factor)
+        for entry in self.heavy.values():
+            entry["weight"] *= factor
+        self.landmark = at
+
+    # ── Ingest ──
+
+    def ingest(self, songs, at, batch_id):
+        """Ingest one extraction batch observed at unix time `at`.
+
+        Returns the number of songs added, or 0 if the batch was seen before.
+        """
+        if batch_id in self.batches:
+            return 0
+        if self.landmark is None:
+            self.landmark = at
+        if self._exponent(at) > RESCALE_EXPONENT:
+            self._rescale(at)
+
+        # Keep the highest source_count if duplicates exist within a batch
+        batch = {}
+        for song in songs:
+            source_count = song.get("source_count", 0)
+            key = make_key(song)
+            if source_count > batch.get(key, 0):
+                batch[key] = source_count
+
+        weight = 2.0 ** self._exponent(at)
+        for key, source_count in batch.items():
+            amount = source_count * weight
+            estimate = self.sketch.add(key, amount)
+            self._track(key, source_count, amount, estimate, at)
+
+        self.batches[batch_id] = at
+        return len(batch)
+
+    def _track(self, key, source_count, amount, estimate, at):
+        """Update the heavy-hitters list (Space-Saving style replacement).
+
+        Tracked songs accumulate exact weight from then on; a newly admitted
+        song starts from its sketch estimate, while `count` only covers
+        batches seen since `tracked_since`.
+        """
+        entry = self.heavy.get(key)
+        if entry is not None:
+            entry["weight"] += amount
+            entry["count"] += source_count
+            entry["last_seen"] = max(entry["last_seen"], at)
+            return
+        if len(self.heavy) < HEAVY_HITTERS:
+            self.heavy[key] = {
+                "weight": estimate, "count": source_count,
+                "tracked_since": at, "last_seen": at,
+            }
+            return
+        # Replace the lightest tracked song if this one now outweighs it
+        lightest = min(self.heavy, key=lambda k: self.heavy[k]["weight"])
+        if estimate > self.heavy[lightest]["weight"]:
+            del self.heavy[lightest]
+            self.heavy[key] = {
+                "weight": estimate, "count": source_count,
+                "tracked_since": at, "last_seen": at,
+            }
+
+    # ── Query ──
+
+    def popularity(self, key, now):
+        """Decayed crowd count for key at unix time `now` (0.0 if unseen)."""
+        if self.landmark is None:
+            return 0.0
+        entry = self.heavy.get(key)
+        raw = entry["weight"] if entry is not None else self.sketch.estimate(key)
+        return raw * 2.0 ** -self._exponent(now)
+
+    def source_count(self, key, now):
+        """Decayed equivalent of enrich_runnability's source_count, or None."""
+        value = self.popularity(key, now)
+        return value if value >= MIN_SIGNAL else None
+
+    def top(self, n, now):
+        decay = 2.0 ** -self._exponent(now) if self.landmark is not None else 0.0
+        ranked = sorted(self.heavy.items(), key=lambda kv: kv[1]["weight"], reverse=True)
+        return [(key, entry["weight"] * decay, entry) for key, entry in ranked[:n]]
+
+
+def _crowd_points(source_count):
+    return None if source_count is None else round(crowd_score(source_count))
+
+
+def apply_to_curated(store, curated, now, replace=False):
+    """Recompute runnability only for songs whose crowd points changed.
+
+    Songs never applied before with no signal in the store keep their
+    current runnability unless `replace` is set, since their crowd points
+    may come from a dump that was never ingested.
+
+    Returns the list of (song, old_runnability) pairs that were updated.
+    """
+    changed = []
+    for song in curated:
+        key = make_key(song)
+        source_count = store.source_count(key, now)
+        points = _crowd_points(source_count)
+        if key in store.applied:
+            if store.applied[key] == points:
+                continue
+        elif points is None and not replace:
+            continue
+        store.applied[key] = points
+        old = song.get("runnability")
+        new = compute_runnability(song, source_count)
+        if new != old:
+            song["runnability"] = new
+            changed.append((song, old))
+    return changed
+
+
+def _batch_id(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _parse_date(value):
+    try:
+        dt = datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a YYYY-MM-DD date, got {value}")
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
+
+def cmd_ingest(args):
+    if not os.path.isfile(args.batch):
+        print(f"Error: {args.batch} not found", file=sys.stderr)
+        return 1
+    store = CrowdSignalStore.load()
+    with open(args.batch) as f:
+        songs = json.load(f)
+    at = args.at if args.at is not None else int(time.time())
+    added = store.ingest(songs, at, _batch_id(args.batch))
+    if added == 0:
+        print(f"Batch {args.batch} already ingested (or empty), nothing to do")
+        return
+    store.save()
+    print(f"Ingested {added} songs from {args.batch}")
+    print(f"  Batches in store:  {len(store.batches)}")
+    print(f"  Heavy hitters:     {len(store.heavy)}/{HEAVY_HITTERS}")
+
+
+def cmd_apply(args):
+    store = CrowdSignalStore.load()
+    if not store.batches:
+        print("Error: no batches ingested yet, refusing to drop crowd signal", file=sys.stderr)
+        return 1
+    with open(CURATED_PATH) as f:
+        curated = json.load(f)
+
+    changed = apply_to_curated(store, curated, int(time.time()), args.replace)
+    print(f"Loaded {len(curated)} curated songs")
+    print(f"Runnability changed: {len(changed)}")
+    for song, old in changed[:20]:
+        print(f"  {song['artistName']} - {song['title']}: {old} -> {song['runnability']}")
+
+    if args.dry_run:
+        return
+    store.save()
+    if changed:
+        with open(CURATED_PATH, "w") as f:
+            json.dump(curated, f, indent=2)
+            f.write("\n")
+        print(f"\nWritten to {CURATED_PATH}")
+        return export_scoring(curated)
+
+
+def cmd_top(args):
+    store = CrowdSignalStore.load()
+    now = int(time.time())
+    for key, popularity, entry in store.top(args.n, now):
+        last_seen = datetime.fromtimestamp(entry["last_seen"], timezone.utc).date()
+        print(f"  {popularity:7.1f}  (count {entry['count']:4d} since tracked, last {last_seen})  {key}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python3 -m tools crowd", description=__doc__.splitlines()[0],
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="ingest an extraction batch")
+    ingest.add_argument("batch", help="extracted_songs.json batch file")
+    ingest.add_argument("--at", type=_parse_date, help="batch date (YYYY-MM-DD), default now")
+    ingest.set_defaults(func=cmd_ingest)
+
+    apply = sub.add_parser("apply", help="recompute changed runnability scores")
+    apply.add_argument("--dry-run", action="store_true")
+    apply.add_argument(
+        "--replace", action="store_true",
+        help="also drop crowd points of songs the store has no signal for",
+    )
+    apply.set_defaults(func=cmd_apply)
+
+    top = sub.add_parser("top", help="show most popular tracked songs")
+    top.add_argument("-n", type=int, default=20)
+    top.set_defaults(func=cmd_top)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """Enrich curated_songs.json with heuristic danceability scores.
 
 Uses genre-based baselines from Spotify/academic research averages,
@@ -13,6 +12,9 @@ References:
 - Karageorghis et al. (2012): rhythm regularity is the #1 predictor
 - Spotify genre averages (pre-deprecation)
 - Moelants (2002): 120-130 BPM = peak synchronization zone
+
+Usage:
+    python3 -m tools enrich danceability
 """
 
 import json
@@ -20,6 +22,9 @@ import hashlib
 import sys
 from pathlib import Path
 
+from .common import CURATED_PATH, normalize_key
+from .scoring_tables import export as export_scoring
+
 # Genre-based danceability baselines (0-100 scale)
 # Derived from Spotify average danceability by genre tag
 GENRE_DANCEABILITY = {
@@ -64,7 +69,7 @@ def deterministic_variance(artist: str, title: str) -> int:
 
     Ensures reproducibility while adding realistic spread.
     """
-    key = f"{artist.lower().strip()}|{title.lower().strip()}"
+    key = normalize_key(artist, title)
     h = int(hashlib.md5(key.encode()).hexdigest()[:8], 16)
     return (h % 9) - 4  # -4 to +4
 
@@ -90,7 +95,7 @@ def compute_danceability(song: dict) -> int:
 
 
 def main():
-    assets_path = Path(__file__).parent.parent / "assets" / "curated_songs.json"
+    assets_path = Path(CURATED_PATH)
 
     if not assets_path.exists():
         print(f"Error: {assets_path} not found", file=sys.stderr)
@@ -133,7 +138,4 @@ def main():
         f.write("\n")
 
     print(f"\nWritten enriched data to {assets_path}")
-
-
-if __name__ == "__main__":
-    main()
+    return export_scoring(songs)
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """Compute runnability scores (0-100) for all curated songs.
 
 Combines crowd signal data (source_count from 2,611 extracted running playlist
@@ -6,16 +5,14 @@ songs) with feature-based estimation (genre, danceability, BPM) to produce a
 single runnability score for each of the 5,066 curated songs.
 
 Usage:
-    python3 tools/enrich_runnability.py
+    python3 -m tools enrich runnability
 """
 
 import json
-import os
 
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+from .common import CURATED_PATH, make_key
+from .scoring_tables import export as export_scoring
 
-CURATED_PATH = os.path.join(PROJECT_ROOT, "assets", "curated_songs.json")
 EXTRACTED_PATH = (
     "/private/tmp/claude-501/-Users-tijmen-running-playlist-ai/"
     "d4738303-92e4-4aa7-a132-232dbf10fcb2/scratchpad/extracted_songs.json"
@@ -61,6 +58,25 @@ def feature_score(genre, danceability, bpm):
     return min(g + d + b, 40)
 
 
+def crowd_score(source_count):
+    """Compute crowd signal score (0-60), saturating at 15 playlist appearances."""
+    return min(source_count / 15.0, 1.0) * 60
+
+
+def compute_runnability(song, source_count):
+    """Compute runnability (0-100) for a song given its crowd source_count.
+
+    ``source_count`` is None when the song has no crowd signal, in which case
+    the score is feature-only and caps at 40.
+    """
+    feat = feature_score(song.get("genre"), song.get("danceability"), song.get("bpm"))
+    if source_count is not None:
+        runnability = round(crowd_score(source_count) + feat)
+    else:
+        runnability = round(feat)
+    return max(0, min(100, runnability))
+
+
 def main():
     # Load data
     with open(EXTRACTED_PATH) as f:
@@ -71,7 +87,7 @@ def main():
     # Build crowd lookup: normalized key -> source_count
     crowd_map = {}
     for song in extracted:
-        key = f"{song['artistName'].lower().strip()}|{song['title'].lower().strip()}"
+        key = make_key(song)
         # Keep the highest source_count if duplicates exist
         if key not in crowd_map or song.get("source_count", 0) > crowd_map[key]:
             crowd_map[key] = song.get("source_count", 0)
@@ -84,26 +100,12 @@ def main():
     scores = []
 
     for song in curated:
-        key = f"{song['artistName'].lower().strip()}|{song['title'].lower().strip()}"
+        key = make_key(song)
         source_count = crowd_map.get(key)
 
-        genre = song.get("genre")
-        danceability = song.get("danceability")
-        bpm = song.get("bpm")
-
-        feat = feature_score(genre, danceability, bpm)
-
         if source_count is not None:
-            # Crowd + feature scoring
             crowd_matched += 1
-            crowd_score = min(source_count / 15.0, 1.0) * 60
-            runnability = round(crowd_score + feat)
-        else:
-            # Feature-only scoring (caps at 40)
-            runnability = round(feat)
-
-        # Clamp to 0-100
-        runnability = max(0, min(100, runnability))
+        runnability = compute_runnability(song, source_count)
         song["runnability"] = runnability
         scores.append(runnability)
 
@@ -140,6 +142,5 @@ def main():
         for m in matches:
             print(f"  {m['title']} ({m['artistName']}): runnability={m['runnability']}")
 
-
-if __name__ == "__main__":
-    main()
+    print()
+    return export_scoring(curated)
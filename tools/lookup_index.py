@@ -0,0 +1,116 @@
+"""On-demand SQLite index over the curated dataset and Deezer caches.
+
+Single-song lookups should not have to parse ~700 KB of curated JSON plus
+the verification and track caches. The first lookup builds
+tools/.lookup_index.sqlite from those files; later lookups open it and do a
+primary-key read. The index is rebuilt whenever a source file's mtime
+changes, so it never needs to be maintained by hand.
+"""
+
+import json
+import os
+import sqlite3
+
+from .common import (
+    CURATED_PATH,
+    TOOLS_DIR,
+    TRACK_CACHE_PATH,
+    VERIFICATION_PATH,
+    normalize_key,
+)
+
+INDEX_PATH = os.path.join(TOOLS_DIR, '.lookup_index.sqlite')
+
+SOURCES = {
+    'curated': CURATED_PATH,
+    'verification': VERIFICATION_PATH,
+    'tracks': TRACK_CACHE_PATH,
+}
+
+
+def _source_mtimes() -> dict:
+    return {
+        name: os.path.getmtime(path) if os.path.exists(path) else None
+        for name, path in SOURCES.items()
+    }
+
+
+def _load(name: str):
+    path = SOURCES[name]
+    if not os.path.exists(path):
+        return [] if name == 'curated' else {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _build(conn: sqlite3.Connection, mtimes: dict):
+    conn.executescript('''
+        DROP TABLE IF EXISTS meta;
+        DROP TABLE IF EXISTS songs;
+        DROP TABLE IF EXISTS tracks;
+        CREATE TABLE meta (name TEXT PRIMARY KEY, mtime REAL);
+        CREATE TABLE songs (key TEXT PRIMARY KEY, curated TEXT, verification TEXT);
+        CREATE TABLE tracks (deezer_id TEXT PRIMARY KEY, data TEXT);
+    ''')
+
+    rows = {}
+    for song in _load('curated'):
+        key = normalize_key(song['artistName'], song['title'])
+        rows[key] = [json.dumps(song), None]
+    for key, result in _load('verification').items():
+        rows.setdefault(key, [None, None])[1] = json.dumps(result)
+
+    conn.executemany(
+        'INSERT INTO songs VALUES (?, ?, ?)',
+        ((key, curated, verification) for key, (curated, verification) in rows.items()),
+    )
+    conn.executemany(
+        'INSERT INTO tracks VALUES (?, ?)',
+        ((deezer_id, json.dumps(data)) for deezer_id, data in _load('tracks').items()),
+    )
+    conn.executemany('INSERT INTO meta VALUES (?, ?)', mtimes.items())
+    conn.commit()
+
+
+def open_index(path: str = INDEX_PATH) -> sqlite3.Connection:
+    """Open the lookup index, (re)building it if any source changed."""
+    conn = sqlite3.connect(path)
+    mtimes = _source_mtimes()
+    try:
+        stored = dict(conn.execute('SELECT name, mtime FROM meta'))
+    except sqlite3.OperationalError:
+        stored = None
+    if stored != mtimes:
+        _build(conn, mtimes)
+    return conn
+
+
+def lookup(artist: str, title: str, conn: sqlite3.Connection | None = None) -> dict | None:
+    """Return everything known about one song, or None if it is unknown.
+
+    The result holds the curated entry, the Deezer verification result and
+    the cached Deezer track (release date), each None when absent.
+    """
+    conn = conn or open_index()
+    key = normalize_key(artist, title)
+    row = conn.execute(
+        'SELECT curated, verification FROM songs WHERE key = ?', (key,)
+    ).fetchone()
+    if row is None:
+        return None
+
+    curated, verification = (json.loads(v) if v else None for v in row)
+    track = None
+    if verification and verification.get('deezer_id'):
+        track_row = conn.execute(
+            'SELECT data FROM tracks WHERE deezer_id = ?',
+            (str(verification['deezer_id']),),
+        ).fetchone()
+        track = json.loads(track_row[0]) if track_row else None
+
+    return {
+        'key': key,
+        'curated': curated,
+        'verification': verification,
+        'track': track,
+    }
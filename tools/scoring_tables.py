@@ -0,0 +1,289 @@
+"""Export precomputed per-song scoring tables for the app.
+
+SongQualityScorer.score recomputes the static parts of a song's score
+(runnability tier, danceability tier, genre membership, BPM variants) for
+every candidate on every generation, although all of their inputs come from
+these enrichment tools. This exports them once, alongside the asset, so the
+runtime only adds the dynamic terms (taste, BPM match type, freshness,
+diversity, likes):
+
+    assets/curated_scoring.json
+        weights       scorer weight constants the table was built against
+        genres        RunningGenre names in bit order for genreMask
+        keys          SongKey.normalize lookup keys
+        staticScore   runnability + danceability points per song
+        genreMask     packed RunningGenre bitmask per song
+        tempoTargets  flat [cadence, BpmMatchType index, ...] pairs per song,
+                      for cadences 1..BpmMatcher.maxQueryBpm
+
+This module is the Python reference implementation of those components.
+Before exporting it checks the reference against the constants, tier
+thresholds and enum orders parsed from the Dart sources and refuses to
+export on any mismatch.
+
+`python3 -m tools enrich ...` and `python3 -m tools crowd apply` re-export
+the table themselves after rewriting the curated asset.
+
+Usage:
+    python3 -m tools scoring           # check, then export
+    python3 -m tools scoring --check   # consistency check only
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+from .common import CURATED_PATH, PROJECT_ROOT, make_key
+
+SCORING_PATH = os.path.join(PROJECT_ROOT, 'assets', 'curated_scoring.json')
+
+SCORER_DART = os.path.join(
+    PROJECT_ROOT, 'lib', 'features', 'song_quality', 'domain', 'song_quality_scorer.dart'
+)
+TASTE_PROFILE_DART = os.path.join(
+    PROJECT_ROOT, 'lib', 'features', 'taste_profile', 'domain', 'taste_profile.dart'
+)
+BPM_SONG_DART = os.path.join(
+    PROJECT_ROOT, 'lib', 'features', 'bpm_lookup', 'domain', 'bpm_song.dart'
+)
+BPM_MATCHER_DART = os.path.join(
+    PROJECT_ROOT, 'lib', 'features', 'bpm_lookup', 'domain', 'bpm_matcher.dart'
+)
+
+TABLE_VERSION = 1
+
+# ── Reference implementation (mirrors SongQualityScorer) ──
+
+WEIGHTS = {
+    'artistMatchWeight': 10,
+    'genreMatchWeight': 6,
+    'exactBpmWeight': 3,
+    'tempoVariantWeight': 1,
+    'artistDiversityPenalty': -5,
+    'dislikedArtistPenalty': -15,
+    'likedSongWeight': 5,
+    'looseTempoVariantWeight': 2,
+    'decadeMatchWeight': 4,
+    'danceabilityMaxWeight': 8,
+    'danceabilityNeutral': 3,
+    'runnabilityMaxWeight': 15,
+    'runnabilityNeutral': 5,
+}
+
+# (minimum value, points), checked top-down; below the last tier scores 0
+DANCEABILITY_TIERS = [(70, WEIGHTS['danceabilityMaxWeight']), (50, 5), (30, 2)]
+RUNNABILITY_TIERS = [(80, WEIGHTS['runnabilityMaxWeight']), (60, 12), (40, 9), (25, 6), (10, 3)]
+
+# RunningGenre enum order (bit positions for genreMask)
+GENRES = [
+    'pop', 'hipHop', 'electronic', 'edm', 'rock', 'indie', 'dance', 'house',
+    'drumAndBass', 'rnb', 'latin', 'metal', 'punk', 'funk', 'kPop',
+]
+
+# BpmMatchType enum order
+MATCH_TYPES = ['exact', 'halfTime', 'doubleTime']
+
+MIN_QUERY_BPM = 40    # BpmMatcher.minQueryBpm
+MAX_QUERY_BPM = 300   # BpmMatcher.maxQueryBpm
+
+
+def _tier_score(value, tiers, neutral):
+    if value is None:
+        return neutral
+    for threshold, points in tiers:
+        if value >= threshold:
+            return points
+    return 0
+
+
+def danceability_score(danceability):
+    return _tier_score(danceability, DANCEABILITY_TIERS, WEIGHTS['danceabilityNeutral'])
+
+
+def runnability_score(runnability):
+    return _tier_score(runnability, RUNNABILITY_TIERS, WEIGHTS['runnabilityNeutral'])
+
+
+def static_score(song):
+    """Score terms that depend only on the song itself."""
+    return runnability_score(song.get('runnability')) + danceability_score(song.get('danceability'))
+
+
+def genre_mask(genres):
+    """Pack genre names into a RunningGenre bitmask (unknown names dropped)."""
+    mask = 0
+    for genre in genres:
+        if genre in GENRES:
+            mask |= 1 << GENRES.index(genre)
+    return mask
+
+
+def tempo_targets(bpm):
+    """Cadences a song of this BPM is served for, as (cadence, match type).
+
+    Inverse of BpmMatcher.bpmQueries over cadences 1..MAX_QUERY_BPM: the
+    song is an exact match for its own BPM, a half-time match for cadences
+    whose `~/ 2` equals it, and a double-time match for the cadence it
+    doubles.
+    """
+    if bpm is None:
+        return []
+    targets = [(bpm, MATCH_TYPES.index('exact'))]
+    if bpm >= MIN_QUERY_BPM:
+        targets += [(2 * bpm, MATCH_TYPES.index('halfTime')),
+                    (2 * bpm + 1, MATCH_TYPES.index('halfTime'))]
+    if bpm % 2 == 0 and bpm <= MAX_QUERY_BPM:
+        targets.append((bpm // 2, MATCH_TYPES.index('doubleTime')))
+    return [(cadence, match) for cadence, match in targets if 1 <= cadence <= MAX_QUERY_BPM]
+
+
+def build_tables(songs):
+    keys, static, masks, tempos = [], [], [], []
+    seen = set()
+    for song in songs:
+        key = make_key(song)
+        if key in seen:
+            continue
+        seen.add(key)
+        keys.append(key)
+        static.append(static_score(song))
+        masks.append(genre_mask([song['genre']] if song.get('genre') else []))
+        tempos.append([v for pair in tempo_targets(song.get('bpm')) for v in pair])
+    return {
+        'version': TABLE_VERSION,
+        'weights': WEIGHTS,
+        'genres': GENRES,
+        'keys': keys,
+        'staticScore': static,
+        'genreMask': masks,
+        'tempoTargets': tempos,
+    }
+
+
+# ── Consistency check against the Dart sources ──
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def _function_body(source, name):
+    start = source.index(f'static int {name}(')
+    end = source.find('\n  }\n', start)
+    return source[start:end]
+
+
+def _dart_tiers(source, name, field):
+    body = _function_body(source, name)
+    tiers = []
+    for threshold, points in re.findall(
+        rf'if \({field} >= (\d+)\) return (\w+);', body
+    ):
+        value = int(points) if points.isdigit() else _dart_constants(source)[points]
+        tiers.append((int(threshold), value))
+    return tiers
+
+
+def _dart_constants(source):
+    return {
+        name: int(value)
+        for name, value in re.findall(r'static const (\w+) = (-?\d+);', source)
+    }
+
+
+def _dart_enum(source, name):
+    start = source.index(f'enum {name} {{') + len(f'enum {name} {{')
+    body = re.sub(r'//.*', '', source[start:])
+    body = re.split(r'[;}]', body, maxsplit=1)[0]
+    return re.findall(r'^\s*(\w+)(?:\(|,|$)', body, re.M)
+
+
+def check_consistency():
+    """Compare the reference implementation with the Dart sources.
+
+    Returns a list of human-readable mismatches (empty when consistent).
+    """
+    errors = []
+    scorer = _read(SCORER_DART)
+
+    dart_weights = _dart_constants(scorer)
+    for name in sorted(set(WEIGHTS) | set(dart_weights)):
+        if WEIGHTS.get(name) != dart_weights.get(name):
+            errors.append(
+                f'SongQualityScorer.{name}: dart={dart_weights.get(name)} '
+                f'python={WEIGHTS.get(name)}'
+            )
+
+    for label, func, field, tiers in (
+        ('danceability', '_danceabilityScore', 'danceability', DANCEABILITY_TIERS),
+        ('runnability', '_runnabilityScore', 'runnability', RUNNABILITY_TIERS),
+    ):
+        dart_tiers = _dart_tiers(scorer, func, field)
+        if dart_tiers != tiers:
+            errors.append(f'{label} tiers: dart={dart_tiers} python={tiers}')
+
+    dart_genres = _dart_enum(_read(TASTE_PROFILE_DART), 'RunningGenre')
+    if dart_genres != GENRES:
+        errors.append(f'RunningGenre order: dart={dart_genres} python={GENRES}')
+
+    dart_match_types = _dart_enum(_read(BPM_SONG_DART), 'BpmMatchType')
+    if dart_match_types != MATCH_TYPES:
+        errors.append(f'BpmMatchType order: dart={dart_match_types} python={MATCH_TYPES}')
+
+    matcher = _dart_constants(_read(BPM_MATCHER_DART))
+    if (matcher.get('minQueryBpm'), matcher.get('maxQueryBpm')) != (MIN_QUERY_BPM, MAX_QUERY_BPM):
+        errors.append(
+            f'BpmMatcher query range: dart={matcher.get("minQueryBpm")}-'
+            f'{matcher.get("maxQueryBpm")} python={MIN_QUERY_BPM}-{MAX_QUERY_BPM}'
+        )
+
+    return errors
+
+
+def _report(errors):
+    if errors:
+        print('Scoring reference is out of sync with the Dart scorer:', file=sys.stderr)
+        for error in errors:
+            print(f'  {error}', file=sys.stderr)
+        return False
+    print('Scoring reference matches SongQualityScorer, RunningGenre and BpmMatcher')
+    return True
+
+
+def export(songs):
+    """Check the reference against the Dart sources, then write SCORING_PATH.
+
+    Called by every command that rewrites the curated asset, so the table
+    never lags behind it. Returns 1 without writing on any mismatch.
+    """
+    if not _report(check_consistency()):
+        print(f'Not exported, {SCORING_PATH} is stale', file=sys.stderr)
+        return 1
+
+    tables = build_tables(songs)
+    with open(SCORING_PATH, 'w') as f:
+        json.dump(tables, f, separators=(',', ':'))
+        f.write('\n')
+
+    static = tables['staticScore']
+    print(f'Exported {len(tables["keys"])} songs to {SCORING_PATH}')
+    print(f'  Static score range: {min(static)}-{max(static)}')
+    print(f'  Avg static score:   {sum(static) / len(static):.1f}')
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m tools scoring', description=__doc__.splitlines()[0],
+    )
+    parser.add_argument('--check', action='store_true', help='consistency check only')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return 0 if _report(check_consistency()) else 1
+
+    with open(CURATED_PATH) as f:
+        songs = json.load(f)
+    return export(songs)
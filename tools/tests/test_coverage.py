@@ -0,0 +1,48 @@
+import math
+
+import pytest
+
+from tools.coverage import CADENCES, analyze, cadence_counts, histogram, main
+
+
+def _dart_compatible(song_bpm, cadence):
+    """bpm_compatibility.dart: match or close against cadence, half, double."""
+    for target in (cadence, cadence // 2, cadence * 2):
+        if abs(song_bpm - target) <= math.ceil(target * 0.05):
+            return True
+    return False
+
+
+def _song(title, bpm=None, genre='pop', decade='2010s'):
+    song = {'artistName': 'Artist', 'title': title, 'genre': genre, 'decade': decade}
+    if bpm is not None:
+        song['bpm'] = bpm
+    return song
+
+
+def test_cadence_counts_match_bpm_compatibility_rule():
+    bpms = list(range(40, 420, 3))
+    counts = cadence_counts(histogram(bpms))
+    for i, cadence in enumerate(CADENCES):
+        assert counts[i] == sum(_dart_compatible(b, cadence) for b in bpms)
+
+
+def test_not_found_songs_are_not_ranked_as_candidates():
+    songs = [_song('Verified'), _song('Fresh', bpm=170), _song('Missing', bpm=170)]
+    progress = {
+        'artist|verified': {'status': 'ok', 'deezer_bpm': 120},
+        'artist|missing': {'status': 'not_found'},
+    }
+
+    result = analyze(songs, progress, depth=5, group_depth=5)
+
+    assert [s['title'] for s, _ in result['unverified']] == ['Fresh']
+    assert [s['title'] for s in result['not_found']] == ['Missing']
+    assert [s['title'] for _, s, _ in result['candidates']] == ['Fresh']
+
+
+@pytest.mark.parametrize('flag', ['--depth', '--group-depth'])
+def test_depths_must_be_positive(flag):
+    with pytest.raises(SystemExit) as exc:
+        main([flag, '0'])
+    assert exc.value.code == 2
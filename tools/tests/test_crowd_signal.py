@@ -0,0 +1,216 @@
+import pytest
+
+from tools import crowd_signal
+from tools.crowd_signal import (
+    DAY_SECONDS,
+    CountMinSketch,
+    CrowdSignalStore,
+    apply_to_curated,
+    main,
+)
+
+T0 = 1_700_000_000
+
+
+def _song(artist, title, source_count=None, **fields):
+    song = {'artistName': artist, 'title': title, **fields}
+    if source_count is not None:
+        song['source_count'] = source_count
+    return song
+
+
+# ── Sketch ──
+
+def test_sketch_never_underestimates_and_conservative_update():
+    sketch = CountMinSketch(width=64, depth=3)
+    for i in range(200):
+        sketch.add(f'song {i}', 1.0)
+    sketch.add('hit', 10.0)
+    assert sketch.estimate('hit') >= 10.0
+    assert all(sketch.estimate(f'song {i}') >= 1.0 for i in range(200))
+
+
+def test_sketch_json_round_trip():
+    sketch = CountMinSketch(width=32, depth=2)
+    sketch.add('a|b', 3.5)
+    restored = CountMinSketch.from_json(sketch.to_json())
+    assert restored.width == 32 and restored.depth == 2
+    assert restored.estimate('a|b') == pytest.approx(3.5)
+
+
+# ── Ingest ──
+
+def test_ingest_keeps_max_source_count_within_batch():
+    store = CrowdSignalStore()
+    added = store.ingest(
+        [_song('A', 'One', 3), _song(' a ', 'one ', 7), _song('B', 'Two', 2)],
+        T0, 'batch-1',
+    )
+    assert added == 2
+    assert store.popularity('a|one', T0) == pytest.approx(7)
+    assert store.popularity('b|two', T0) == pytest.approx(2)
+
+
+def test_reingesting_same_batch_is_noop():
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 3)], T0, 'batch-1')
+    assert store.ingest([_song('A', 'One', 3)], T0, 'batch-1') == 0
+    assert store.popularity('a|one', T0) == pytest.approx(3)
+
+
+def test_batches_accumulate_with_tracking_fields():
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 3)], T0, 'batch-1')
+    store.ingest([_song('A', 'One', 2)], T0 + DAY_SECONDS, 'batch-2')
+    entry = store.heavy['a|one']
+    assert entry['count'] == 5
+    assert entry['tracked_since'] == T0
+    assert entry['last_seen'] == T0 + DAY_SECONDS
+
+
+# ── Decay ──
+
+def test_popularity_halves_every_half_life():
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 8)], T0, 'batch-1')
+    assert store.popularity('a|one', T0 + store.half_life) == pytest.approx(4)
+    assert store.popularity('a|one', T0 + 2 * store.half_life) == pytest.approx(2)
+
+
+def test_newer_batches_outweigh_older_ones():
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'Old', 4)], T0, 'batch-1')
+    store.ingest([_song('B', 'New', 4)], T0 + store.half_life, 'batch-2')
+    now = T0 + store.half_life
+    assert store.popularity('b|new', now) == pytest.approx(4)
+    assert store.popularity('a|old', now) == pytest.approx(2)
+
+
+def test_source_count_below_min_signal_is_none():
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 2)], T0, 'batch-1')
+    assert store.source_count('a|one', T0) == pytest.approx(2)
+    assert store.source_count('a|one', T0 + 2 * store.half_life) is None
+    assert store.source_count('never|seen', T0) is None
+
+
+def test_rescale_moves_landmark_and_preserves_popularity(monkeypatch):
+    monkeypatch.setattr(crowd_signal, 'RESCALE_EXPONENT', 1)
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 8)], T0, 'batch-1')
+    later = T0 + 3 * store.half_life
+    store.ingest([_song('B', 'Two', 4)], later, 'batch-2')
+    assert store.landmark == later
+    assert store.popularity('a|one', later) == pytest.approx(1)
+    assert store.popularity('b|two', later) == pytest.approx(4)
+
+
+# ── Heavy hitters ──
+
+def test_eviction_replaces_lightest_tracked_song(monkeypatch):
+    monkeypatch.setattr(crowd_signal, 'HEAVY_HITTERS', 2)
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 5), _song('B', 'Two', 1)], T0, 'batch-1')
+    store.ingest([_song('C', 'Three', 3)], T0, 'batch-2')
+    assert set(store.heavy) == {'a|one', 'c|three'}
+    # Evicted songs still answer from the sketch
+    assert store.popularity('b|two', T0) >= 1
+
+
+def test_lighter_song_is_not_admitted_when_full(monkeypatch):
+    monkeypatch.setattr(crowd_signal, 'HEAVY_HITTERS', 1)
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 5)], T0, 'batch-1')
+    store.ingest([_song('B', 'Two', 1)], T0, 'batch-2')
+    assert set(store.heavy) == {'a|one'}
+    assert [key for key, _, _ in store.top(5, T0)] == ['a|one']
+
+
+# ── Persistence ──
+
+def test_save_load_round_trip(tmp_path):
+    path = tmp_path / 'crowd_signal.json'
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 6), _song('B', 'Two', 2)], T0, 'batch-1')
+    store.applied['a|one'] = 24
+    store.save(path)
+
+    restored = CrowdSignalStore.load(path)
+    assert restored.landmark == store.landmark
+    assert restored.half_life == store.half_life
+    assert restored.batches == store.batches
+    assert restored.heavy == store.heavy
+    assert restored.applied == {'a|one': 24}
+    for key in ('a|one', 'b|two'):
+        assert restored.popularity(key, T0) == pytest.approx(store.popularity(key, T0))
+
+
+def test_load_missing_file_gives_empty_store(tmp_path):
+    store = CrowdSignalStore.load(tmp_path / 'missing.json')
+    assert store.landmark is None
+    assert store.popularity('a|one', T0) == 0.0
+
+
+# ── Apply ──
+
+def _curated(artist, title, runnability, **fields):
+    return _song(
+        artist, title, genre='pop', danceability=70, bpm=130,
+        runnability=runnability, **fields,
+    )
+
+
+def test_first_apply_leaves_songs_without_signal_untouched():
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 15)], T0, 'batch-1')
+    in_batch = _curated('A', 'One', 10)
+    not_in_batch = _curated('B', 'Two', 50)
+
+    changed = apply_to_curated(store, [in_batch, not_in_batch], T0)
+
+    assert [song for song, _ in changed] == [in_batch]
+    assert in_batch['runnability'] > 40
+    assert not_in_batch['runnability'] == 50
+    assert 'b|two' not in store.applied
+
+
+def test_replace_drops_crowd_points_of_songs_without_signal():
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 15)], T0, 'batch-1')
+    not_in_batch = _curated('B', 'Two', 50)
+
+    apply_to_curated(store, [not_in_batch], T0, replace=True)
+
+    assert not_in_batch['runnability'] <= 40
+    assert store.applied['b|two'] is None
+
+
+def test_apply_only_recomputes_songs_whose_points_changed():
+    store = CrowdSignalStore()
+    store.ingest([_song('A', 'One', 15)], T0, 'batch-1')
+    song = _curated('A', 'One', 10)
+    apply_to_curated(store, [song], T0)
+
+    song['runnability'] = 77   # untouched unless its crowd points change
+    assert apply_to_curated(store, [song], T0) == []
+    assert song['runnability'] == 77
+
+    # Once the signal has decayed away, the song falls back to feature-only
+    changed = apply_to_curated(store, [song], T0 + 10 * store.half_life)
+    assert changed == [(song, 77)]
+    assert song['runnability'] <= 40
+
+
+# ── CLI ──
+
+def test_ingest_rejects_malformed_date(tmp_path):
+    batch = tmp_path / 'batch.json'
+    batch.write_text('[]')
+    with pytest.raises(SystemExit) as exc:
+        main(['ingest', str(batch), '--at', '2026-13-01'])
+    assert exc.value.code == 2
+
+
+def test_ingest_reports_missing_batch(tmp_path, capsys):
+    assert main(['ingest', str(tmp_path / 'missing.json')]) == 1
+    assert 'not found' in capsys.readouterr().err
@@ -0,0 +1,59 @@
+import argparse
+import json
+
+from tools import crowd_signal, scoring_tables
+from tools.scoring_tables import (
+    MATCH_TYPES,
+    MAX_QUERY_BPM,
+    MIN_QUERY_BPM,
+    check_consistency,
+    tempo_targets,
+)
+
+
+def _bpm_queries(target):
+    """BpmMatcher.bpmQueries, as in bpm_matcher.dart."""
+    queries = {target: 'exact'}
+    if target // 2 >= MIN_QUERY_BPM:
+        queries[target // 2] = 'halfTime'
+    if target * 2 <= MAX_QUERY_BPM:
+        queries[target * 2] = 'doubleTime'
+    return queries
+
+
+def test_reference_matches_dart_sources():
+    assert check_consistency() == []
+
+
+def test_tempo_targets_are_complete_inverse_of_bpm_queries():
+    for bpm in range(0, 2 * MAX_QUERY_BPM + 2):
+        expected = {
+            (cadence, MATCH_TYPES.index(_bpm_queries(cadence)[bpm]))
+            for cadence in range(1, MAX_QUERY_BPM + 1)
+            if bpm in _bpm_queries(cadence)
+        }
+        assert set(tempo_targets(bpm)) == expected, bpm
+    assert tempo_targets(None) == []
+
+
+def test_crowd_apply_re_exports_scoring_table(tmp_path, monkeypatch):
+    curated_path = tmp_path / 'curated_songs.json'
+    scoring_path = tmp_path / 'curated_scoring.json'
+    curated_path.write_text(json.dumps([{
+        'artistName': 'A', 'title': 'One', 'genre': 'pop',
+        'danceability': 70, 'bpm': 170, 'runnability': 10,
+    }]))
+    store = crowd_signal.CrowdSignalStore()
+    store.ingest([{'artistName': 'A', 'title': 'One', 'source_count': 15}], 1_700_000_000, 'batch-1')
+    monkeypatch.setattr(crowd_signal.CrowdSignalStore, 'load', classmethod(lambda cls: store))
+    monkeypatch.setattr(crowd_signal.CrowdSignalStore, 'save', lambda self: None)
+    monkeypatch.setattr(crowd_signal, 'CURATED_PATH', str(curated_path))
+    monkeypatch.setattr(scoring_tables, 'SCORING_PATH', str(scoring_path))
+    monkeypatch.setattr(crowd_signal.time, 'time', lambda: 1_700_000_000)
+
+    assert crowd_signal.cmd_apply(argparse.Namespace(dry_run=False, replace=False)) == 0
+
+    tables = json.loads(scoring_path.read_text())
+    assert tables['keys'] == ['a|one']
+    song = json.loads(curated_path.read_text())[0]
+    assert tables['staticScore'] == [scoring_tables.static_score(song)]
@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from tools import verify_queue
+from tools.verify_queue import Budget, build_queue, main
+
+NOW = 1_700_000_000
+
+
+def _song(title, runnability, bpm=130):
+    return {'artistName': 'Artist', 'title': title, 'runnability': runnability, 'bpm': bpm}
+
+
+def test_queue_orders_unverified_high_runnability_first(monkeypatch):
+    monkeypatch.setattr(verify_queue, '_crowd_counts', lambda songs, now: {})
+    songs = [_song('Low', 10), _song('High', 90), _song('Done', 95)]
+    progress = {'artist|done': {'status': 'ok', 'deezer_bpm': 130, 'verified_at': NOW}}
+
+    queue = build_queue(songs, progress, NOW)
+
+    assert [song['title'] for _, _, song in sorted(queue)] == ['High', 'Low']
+
+
+def test_request_budget_counts_worst_case_calls():
+    budget = Budget(max_requests=3, max_minutes=None)
+    assert budget.can_afford(2)
+    budget.spend(2)
+    assert not budget.can_afford(2)
+
+
+def test_idle_sleep_never_outlasts_the_deadline():
+    budget = Budget(max_requests=None, max_minutes=10)
+    assert budget.idle_sleep(3600) == 0
+    assert budget.idle_sleep(60) == 60
+    assert Budget(None, None).idle_sleep(3600) == 3600
+
+
+def test_zero_minutes_is_an_exhausted_budget_not_an_unlimited_one():
+    budget = Budget(max_requests=None, max_minutes=0)
+    assert not budget.can_afford(1)
+    assert budget.idle_sleep(60) == 0
+
+
+@pytest.mark.parametrize('flag', ['--max-requests', '--max-minutes'])
+def test_budgets_reject_negative_values(flag):
+    with pytest.raises(SystemExit):
+        main([flag, '-1'])
+
+
+def test_continuous_run_exits_instead_of_sleeping_past_deadline(monkeypatch):
+    monkeypatch.setattr(verify_queue, 'load_progress', lambda: {})
+    monkeypatch.setattr(verify_queue, 'save_progress', lambda progress: None)
+    monkeypatch.setattr(verify_queue, 'save_verification', lambda progress: None)
+    monkeypatch.setattr(verify_queue, 'run', lambda songs, progress, budget: 0)
+    monkeypatch.setattr(verify_queue.json, 'load', lambda f: [])
+    monkeypatch.setattr(time, 'sleep', pytest.fail)
+
+    assert main(['--continuous', '--max-minutes', '10']) == 0
+
+
+def test_plan_rejects_non_positive_counts():
+    with pytest.raises(SystemExit):
+        main(['--plan', '0'])
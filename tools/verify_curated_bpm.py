@@ -1,8 +1,7 @@
-#!/usr/bin/env python3
 """Verify curated_songs.json BPM and duration against Deezer API.
 
 Usage:
-    python3 tools/verify_curated_bpm.py
+    python3 -m tools verify
 
 Outputs:
     tools/bpm_report.txt        - Human-readable mismatch report
@@ -15,44 +14,30 @@ Saves progress every 50 songs so you can Ctrl+C and resume.
 
 import json
 import os
-import subprocess
-import sys
 import time
 import urllib.parse
 
-CURATED_PATH = os.path.join(
-    os.path.dirname(__file__), '..', 'assets', 'curated_songs.json'
+from .common import (
+    API_DELAY,
+    BPM_PROGRESS_PATH as PROGRESS_PATH,
+    BPM_REPORT_PATH as REPORT_PATH,
+    CORRECTED_PATH,
+    CURATED_PATH,
+    SAVE_INTERVAL,
+    VERIFICATION_PATH,
+    curl_json,
+    make_key,
 )
-PROGRESS_PATH = os.path.join(os.path.dirname(__file__), 'bpm_progress.json')
-REPORT_PATH = os.path.join(os.path.dirname(__file__), 'bpm_report.txt')
-CORRECTED_PATH = os.path.join(os.path.dirname(__file__), 'curated_songs_corrected.json')
-VERIFICATION_PATH = os.path.join(os.path.dirname(__file__), 'bpm_verification.json')
 
 BPM_TOLERANCE = 3       # BPM difference to flag as mismatch
 DURATION_TOLERANCE = 15  # seconds difference to flag
-API_DELAY = 0.35         # seconds between API calls
-SAVE_INTERVAL = 50       # save progress every N songs
-
-
-def _curl_json(url: str) -> dict | None:
-    """Fetch a URL with curl and parse as JSON."""
-    try:
-        result = subprocess.run(
-            ['curl', '-s', '--max-time', '10', url],
-            capture_output=True, text=True, timeout=15,
-        )
-        if result.returncode != 0:
-            return None
-        return json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError):
-        return None
 
 
 def deezer_search(artist: str, title: str) -> dict | None:
     """Search Deezer for a track, return first result or None."""
     query = f'{artist} {title}'
     url = f'https://api.deezer.com/search?q={urllib.parse.quote(query)}&limit=3'
-    data = _curl_json(url)
+    data = curl_json(url)
     if data is None:
         return None
     results = data.get('data', [])
@@ -72,12 +57,45 @@ def deezer_search(artist: str, title: str) -> dict | None:
 def deezer_track(track_id: int) -> dict | None:
     """Get full track details including BPM."""
     url = f'https://api.deezer.com/track/{track_id}'
-    data = _curl_json(url)
+    data = curl_json(url)
     if data is None or 'error' in data:
         return None
     return data
 
 
+def verify_song(song: dict) -> tuple[dict, int]:
+    """Search + fetch one song from Deezer.
+
+    Returns the progress entry (stamped with ``verified_at``) and the number
+    of API calls spent, so callers can enforce request budgets.
+    """
+    search_result = deezer_search(song['artistName'], song['title'])
+    time.sleep(API_DELAY)
+    calls = 1
+
+    if search_result is None:
+        result = {'status': 'not_found'}
+    else:
+        track = deezer_track(search_result['id'])
+        time.sleep(API_DELAY)
+        calls += 1
+
+        if track is None:
+            result = {'status': 'not_found'}
+        else:
+            result = {
+                'status': 'ok',
+                'deezer_id': track.get('id'),
+                'deezer_title': track.get('title', ''),
+                'deezer_artist': track.get('artist', {}).get('name', ''),
+                'deezer_bpm': track.get('bpm', 0),
+                'deezer_duration': track.get('duration', 0),
+            }
+
+    result['verified_at'] = int(time.time())
+    return result, calls
+
+
 def load_progress() -> dict:
     """Load saved progress, or empty dict."""
     if os.path.exists(PROGRESS_PATH):
@@ -91,8 +109,10 @@ def save_progress(progress: dict):
         json.dump(progress, f)
 
 
-def make_key(song: dict) -> str:
-    return f"{song['artistName'].lower().strip()}|{song['title'].lower().strip()}"
+def save_verification(progress: dict):
+    """Write the full verification data read by `cleanup` and `lookup`."""
+    with open(VERIFICATION_PATH, 'w') as f:
+        json.dump(progress, f, indent=2)
 
 
 def main():
@@ -118,29 +138,8 @@ def main():
         if key in progress:
             result = progress[key]
         else:
-            # Search + fetch from Deezer
-            search_result = deezer_search(song['artistName'], song['title'])
-            time.sleep(API_DELAY)
-
-            if search_result is None:
-                result = {'status': 'not_found'}
-                progress[key] = result
-            else:
-                track = deezer_track(search_result['id'])
-                time.sleep(API_DELAY)
-
-                if track is None:
-                    result = {'status': 'not_found'}
-                else:
-                    result = {
-                        'status': 'ok',
-                        'deezer_id': track.get('id'),
-                        'deezer_title': track.get('title', ''),
-                        'deezer_artist': track.get('artist', {}).get('name', ''),
-                        'deezer_bpm': track.get('bpm', 0),
-                        'deezer_duration': track.get('duration', 0),
-                    }
-                progress[key] = result
+            result, _ = verify_song(song)
+            progress[key] = result
 
             # Save progress periodically
             if (i + 1) % SAVE_INTERVAL == 0:
@@ -254,12 +253,7 @@ def main():
     print(f'Corrected JSON written to: {CORRECTED_PATH} ({corrections_made} BPM corrections)')
 
     # Save full verification data
-    with open(VERIFICATION_PATH, 'w') as f:
-        json.dump(progress, f, indent=2)
+    save_verification(progress)
 
     print(f'Full verification data: {VERIFICATION_PATH}')
     print(f'\nDone! Review {REPORT_PATH} then copy corrected JSON to assets/')
-
-
-if __name__ == '__main__':
-    main()
@@ -0,0 +1,252 @@
+"""Priority-scheduled Deezer verification for curated songs.
+
+`verify` walks curated_songs.json in file order, so an interrupted run leaves
+high-impact songs unverified while obscure ones are done. This scheduler
+orders pending Deezer work by expected impact instead:
+
+    priority = impact * urgency
+    impact   = 1 + runnability + crowd signal + missing BPM   (weighted)
+    urgency  = 1.0 for never-verified songs, otherwise grows with the age of
+               the last verification (0 until MIN_REVERIFY_DAYS have passed)
+
+Work is bounded by a request budget (Deezer API calls) and/or a time budget.
+Progress is shared with `verify` (tools/bpm_progress.json) and every result
+is stamped with `verified_at`, so each run picks up where the last one left
+off. tools/bpm_verification.json is rewritten at the end of each run so
+`lookup` and `cleanup` see the new results.
+
+`--continuous` keeps re-verifying in the background, sleeping while nothing
+is due, until a budget runs out.
+
+Usage:
+    python3 -m tools verify-queue --max-requests 2000
+    python3 -m tools verify-queue --max-minutes 60 --continuous
+    python3 -m tools verify-queue --plan 20
+"""
+
+import argparse
+import heapq
+import json
+import os
+import time
+
+from .common import CURATED_PATH, SAVE_INTERVAL, make_key
+from .verify_curated_bpm import (
+    load_progress,
+    save_progress,
+    save_verification,
+    verify_song,
+)
+
+# ── Impact weights ──
+RUNNABILITY_WEIGHT = 2.0   # scaled by runnability / 100
+CROWD_WEIGHT = 1.5         # scaled by source_count / 15 (saturating)
+MISSING_BPM_WEIGHT = 1.0   # no curated BPM, or Deezer had BPM=0
+
+# ── Urgency ──
+MIN_REVERIFY_DAYS = 30     # verified songs are not due before this age
+STALE_DAYS = 365           # age at which re-verification urgency saturates
+REVERIFY_WEIGHT = 0.5      # max urgency of a re-verification vs. a first one
+
+CALLS_PER_SONG = 2         # search + track lookup (worst case)
+IDLE_SLEEP = 3600          # continuous mode: seconds to wait when nothing is due
+
+DAY_SECONDS = 86400
+
+
+def _missing_bpm(song: dict, result: dict | None) -> bool:
+    if song.get('bpm') is None:
+        return True
+    return bool(result) and result.get('status') == 'ok' and not result.get('deezer_bpm')
+
+
+def urgency(result: dict | None, now: float) -> float:
+    """How overdue a song's verification is (0 = not due)."""
+    if result is None:
+        return 1.0
+    verified_at = result.get('verified_at')
+    # Entries from before verified_at was recorded count as fully stale
+    age_days = STALE_DAYS if verified_at is None else (now - verified_at) / DAY_SECONDS
+    if age_days < MIN_REVERIFY_DAYS:
+        return 0.0
+    return REVERIFY_WEIGHT * min(age_days / STALE_DAYS, 1.0)
+
+
+def impact(song: dict, result: dict | None, source_count: float | None) -> float:
+    """Expected value of (re-)verifying a song, independent of timing."""
+    runnability = song.get('runnability') or 0
+    crowd = min((source_count or 0) / 15.0, 1.0)
+    return (
+        1.0
+        + RUNNABILITY_WEIGHT * runnability / 100
+        + CROWD_WEIGHT * crowd
+        + MISSING_BPM_WEIGHT * _missing_bpm(song, result)
+    )
+
+
+def priority(song: dict, result: dict | None, source_count: float | None, now: float) -> float:
+    return impact(song, result, source_count) * urgency(result, now)
+
+
+def _crowd_counts(songs: list, now: float) -> dict:
+    """Decayed crowd source_count per curated key, if a crowd store exists."""
+    from .crowd_signal import STORE_PATH, CrowdSignalStore
+
+    if not os.path.exists(STORE_PATH):
+        return {}
+    store = CrowdSignalStore.load()
+    return {make_key(s): store.source_count(make_key(s), now) for s in songs}
+
+
+def build_queue(songs: list, progress: dict, now: float) -> list:
+    """Heap of (-priority, position, song) for every song that is due."""
+    crowd = _crowd_counts(songs, now)
+    queue = []
+    seen = set()
+    for i, song in enumerate(songs):
+        key = make_key(song)
+        if key in seen:
+            continue
+        seen.add(key)
+        p = priority(song, progress.get(key), crowd.get(key), now)
+        if p > 0:
+            queue.append((-p, i, song))
+    heapq.heapify(queue)
+    return queue
+
+
+class Budget:
+    """Request and wall-clock budget for one scheduler run."""
+
+    def __init__(self, max_requests: int | None, max_minutes: float | None):
+        self.max_requests = max_requests
+        self.deadline = time.time() + max_minutes * 60 if max_minutes is not None else None
+        self.requests = 0
+
+    def can_afford(self, calls: int) -> bool:
+        if self.max_requests is not None and self.requests + calls > self.max_requests:
+            return False
+        if self.deadline is not None and time.time() >= self.deadline:
+            return False
+        return True
+
+    def spend(self, calls: int):
+        self.requests += calls
+
+    def idle_sleep(self, seconds: float) -> float:
+        """Seconds to sleep before checking for due songs again.
+
+        Returns 0 when the deadline would pass during the sleep, since no
+        work could be done afterwards.
+        """
+        if self.deadline is None:
+            return seconds
+        return seconds if self.deadline - time.time() > seconds else 0
+
+
+def run(songs: list, progress: dict, budget: Budget) -> int:
+    """Verify due songs in priority order until the budget or queue runs out.
+
+    Returns the number of songs verified.
+    """
+    queue = build_queue(songs, progress, time.time())
+    print(f'{len(queue)} songs due for verification')
+
+    verified = 0
+    while queue and budget.can_afford(CALLS_PER_SONG):
+        neg_priority, _, song = heapq.heappop(queue)
+        key = make_key(song)
+        result, calls = verify_song(song)
+        budget.spend(calls)
+        previous = progress.get(key)
+        if result['status'] != 'ok' and previous and previous.get('status') == 'ok':
+            # A failed re-check is more likely a network blip than a delisting
+            result = {**previous, 'verified_at': result['verified_at']}
+        progress[key] = result
+        verified += 1
+
+        if verified % SAVE_INTERVAL == 0:
+            save_progress(progress)
+            print(
+                f'  [{verified}] {budget.requests} requests spent, '
+                f'last priority {-neg_priority:.2f} - saved progress'
+            )
+    return verified
+
+
+def print_plan(songs: list, progress: dict, n: int):
+    queue = build_queue(songs, progress, time.time())
+    print(f'{len(queue)} songs due for verification, next {min(n, len(queue))}:')
+    for neg_priority, _, song in heapq.nsmallest(n, queue):
+        print(
+            f'  {-neg_priority:5.2f}  runnability={song.get("runnability")!s:>4}'
+            f'  {song["artistName"]} - {song["title"]}'
+        )
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f'expected a positive integer, got {value}')
+    return n
+
+
+def _non_negative_int(value: str) -> int:
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f'expected a non-negative integer, got {value}')
+    return n
+
+
+def _non_negative_float(value: str) -> float:
+    x = float(value)
+    if not x >= 0:
+        raise argparse.ArgumentTypeError(f'expected a non-negative number, got {value}')
+    return x
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m tools verify-queue', description=__doc__.splitlines()[0],
+    )
+    parser.add_argument('--max-requests', type=_non_negative_int, help='Deezer API call budget')
+    parser.add_argument('--max-minutes', type=_non_negative_float, help='wall-clock budget')
+    parser.add_argument(
+        '--continuous', action='store_true',
+        help='keep re-verifying as songs become due (until a budget runs out)',
+    )
+    parser.add_argument('--plan', type=_positive_int, metavar='N', help='show the next N songs and exit')
+    args = parser.parse_args(argv)
+
+    with open(CURATED_PATH) as f:
+        songs = json.load(f)
+    progress = load_progress()
+    print(f'Loaded {len(songs)} curated songs, {len(progress)} with verification results')
+
+    if args.plan is not None:
+        print_plan(songs, progress, args.plan)
+        return 0
+
+    budget = Budget(args.max_requests, args.max_minutes)
+    total = 0
+    try:
+        while True:
+            total += run(songs, progress, budget)
+            save_progress(progress)
+            if not args.continuous or not budget.can_afford(CALLS_PER_SONG):
+                break
+            sleep = budget.idle_sleep(IDLE_SLEEP)
+            if not sleep:
+                print('Nothing due before the time budget runs out')
+                break
+            print(f'Nothing due, sleeping {sleep}s')
+            time.sleep(sleep)
+    except KeyboardInterrupt:
+        print('\nInterrupted')
+    finally:
+        save_progress(progress)
+        save_verification(progress)
+
+    print(f'\nVerified {total} songs using {budget.requests} API requests')
+    print('Run `python3 -m tools verify` to regenerate the report once the backlog is done')
+    return 0